@@ -3,6 +3,8 @@
 Example script demonstrating playlist download functionality
 """
 
+import logging
+from itertools import islice
 from youtube_audio_downloader import YouTubeAudioDownloader
 
 def main():
@@ -69,7 +71,7 @@ def download_with_options_example():
         print(f"Playlist has {info['video_count']} videos")
         
         # Show first few video titles
-        for i, video in enumerate(info['videos'][:3], 1):
+        for i, video in enumerate(islice(info['videos'], 3), 1):
             print(f"{i}. {video['title']} ({video['duration']}s)")
             
     except Exception as e:
@@ -107,6 +109,9 @@ def batch_playlist_download():
             print(f"Failed: {e}")
 
 if __name__ == "__main__":
+    # Show the downloader's progress messages
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     print("Choose an example to run:")
     print("1. Interactive playlist downloader")
     print("2. Download with custom options")
@@ -40,6 +40,7 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "yt-dlp>=2024.1.0",
+        "requests>=2.32.2",
     ],
     entry_points={
         "console_scripts": [
@@ -11,58 +11,234 @@ This is the simplified version without continuous monitoring features.
 import os
 import sys
 import argparse
+import asyncio
+import logging
+import logging.handlers
 import re
 import time
+import copy
+import functools
+import json
+import zlib
 import shutil
+import sqlite3
+import queue
+import random
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+from weakref import WeakSet
 from urllib.parse import urlparse, parse_qs
 import yt_dlp
 
+logger = logging.getLogger(__name__)
+
 # Try to import pydub, but provide fallback if not available
 try:
     from pydub import AudioSegment
     PYDUB_AVAILABLE = True
 except ImportError:
     PYDUB_AVAILABLE = False
-    print("Warning: pydub not available, using yt-dlp for audio conversion")
+    logger.warning("Warning: pydub not available, using yt-dlp for audio conversion")
+
+# URL patterns, compiled once at import time
+_YOUTUBE_URL_RE = re.compile(
+    r'(?:https?://)?(?:www\.)?(?:youtube|youtu|youtube-nocookie)\.(?:com|be)/'
+    r'(?:watch\?v=|embed/|v/|shorts/|live/|.+\?v=)?([^&=%\?]{11})'
+)
+# Matches ?list= and &list= in playlist and watch URLs alike
+_PLAYLIST_RE = re.compile(r'[&?]list=([a-zA-Z0-9_-]+)')
+
+# yt-dlp error messages (lowercased) that indicate a transient failure worth retrying
+_TRANSIENT_ERRORS = (
+    'http error 429',
+    'http error 5',
+    'unable to download',
+    'timed out',
+    'connection reset',
+    'remote end closed',
+    'temporary failure in name resolution',
+)
+
+
+def _is_reusable_for_download(info):
+    """Check whether a metadata info dict (extracted without DASH/HLS
+    manifests) still has the formats needed to download the video."""
+    return bool(info.get('formats')) and info.get('live_status') not in (
+        'is_live', 'is_upcoming', 'post_live'
+    )
+
+
+def _formats_expire_at(info):
+    """Return the earliest 'expire' timestamp in the info dict's format URLs, or None."""
+    expire_times = []
+    for fmt in info.get('formats') or []:
+        expire = parse_qs(urlparse(fmt.get('url') or '').query).get('expire')
+        if expire and expire[0].isdigit():
+            expire_times.append(int(expire[0]))
+    return min(expire_times, default=None)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_ffmpeg():
+    """Locate the FFmpeg executable (cross-platform), or return None.
+    
+    The result is cached, so creating several downloaders only searches once.
+    """
+    ffmpeg_path = shutil.which('ffmpeg')
+    if ffmpeg_path:
+        return ffmpeg_path
+    
+    # Try common locations on this platform
+    if sys.platform == 'win32':
+        common_paths = [
+            'C:\\ffmpeg\\bin\\ffmpeg.exe',  # Windows common location
+            'C:\\Program Files\\ffmpeg\\bin\\ffmpeg.exe',  # Windows Program Files
+        ]
+    else:
+        common_paths = [
+            '/usr/local/bin/ffmpeg',  # macOS Homebrew
+            '/usr/bin/ffmpeg',        # Linux
+            '/opt/homebrew/bin/ffmpeg',  # macOS Apple Silicon Homebrew
+        ]
+    
+    for path in common_paths:
+        if os.path.exists(path):
+            return path
+    
+    return None
+
+
+class RateLimiter:
+    """Spaces out calls from any number of threads by at least `interval` seconds."""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+    
+    def acquire(self):
+        """Block until the next call is allowed to start."""
+        if self.interval <= 0:
+            return
+        
+        with self._lock:
+            wait = self._next - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._next = time.monotonic() + self.interval
+
+
+class _YtDlpLogger:
+    """Routes yt-dlp's console output through the module logger."""
+    
+    def debug(self, msg):
+        # yt-dlp sends its regular screen output through debug() as well
+        if msg.startswith('[debug] '):
+            logger.debug(msg)
+        else:
+            logger.info(msg)
+    
+    def info(self, msg):
+        logger.info(msg)
+    
+    def warning(self, msg):
+        logger.warning(msg)
+    
+    def error(self, msg):
+        logger.error(msg)
 
 
 class YouTubeAudioDownloader:
-    def __init__(self, output_dir="downloads"):
-        """Initialize the downloader with an output directory."""
+    # Maximum number of extracted video info dicts kept in memory
+    INFO_CACHE_SIZE = 1000
+    
+    # Seconds an in-memory info dict is reused; its signed format URLs expire
+    INFO_CACHE_TTL = 30 * 60
+    
+    # Default lifetime of the on-disk metadata cache (7 days)
+    METADATA_TTL = 7 * 24 * 60 * 60
+    
+    # Attempts made for a yt-dlp call before a transient error is given up on
+    RETRY_ATTEMPTS = 3
+    
+    # Number of playlist entries listed ahead of the download workers
+    PLAYLIST_QUEUE_SIZE = 8
+    
+    # Page requested in the background to warm up the connection to YouTube
+    PREWARM_URL = 'https://www.youtube.com/'
+    
+    # Number of video metadata lookups run at once by get_playlist_info_fast
+    METADATA_CONCURRENCY = 8
+    
+    # Characters that are invalid in filenames, all mapped to '_'
+    _SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+    
+    def __init__(self, output_dir="downloads", metadata_ttl=METADATA_TTL, prewarm=False):
+        """Initialize the downloader with an output directory.
+        
+        With prewarm=True a background request to YouTube opens the shared
+        session's TLS connection early, so the first lookup doesn't pay for
+        the handshake.
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
-        # Find FFmpeg location (cross-platform)
-        ffmpeg_path = shutil.which('ffmpeg')
+        # Video and playlist metadata persisted across runs
+        self.metadata_ttl = metadata_ttl
+        self._cache_path = self.output_dir / '.yt_metadata.sqlite'
+        self._init_metadata_cache()
+        
+        # Recently extracted yt-dlp info dicts keyed by video ID (LRU order), so
+        # a download can reuse the metadata fetched for it instead of re-extracting
+        self._info_cache = OrderedDict()
+        self._info_cache_lock = threading.Lock()
+        
+        # Backoff sleeps are taken one at a time so backed-off workers don't
+        # all hit YouTube again at the same moment
+        self._retry_gate = threading.Semaphore(1)
+        
+        ffmpeg_path = _find_ffmpeg()
         if not ffmpeg_path:
-            # Try common locations on different systems
-            common_paths = [
-                '/usr/local/bin/ffmpeg',  # macOS Homebrew
-                '/usr/bin/ffmpeg',        # Linux
-                '/opt/homebrew/bin/ffmpeg',  # macOS Apple Silicon Homebrew
-                'C:\\ffmpeg\\bin\\ffmpeg.exe',  # Windows common location
-                'C:\\Program Files\\ffmpeg\\bin\\ffmpeg.exe',  # Windows Program Files
-            ]
-            
-            for path in common_paths:
-                if os.path.exists(path):
-                    ffmpeg_path = path
-                    break
-            
-            if not ffmpeg_path:
-                raise Exception(
-                    "FFmpeg not found. Please install FFmpeg:\n"
-                    "• macOS: brew install ffmpeg\n"
-                    "• Ubuntu/Debian: sudo apt install ffmpeg\n"
-                    "• Windows: Download from https://ffmpeg.org/download.html\n"
-                    "Make sure FFmpeg is in your system PATH."
-                )
+            raise Exception(
+                "FFmpeg not found. Please install FFmpeg:\n"
+                "• macOS: brew install ffmpeg\n"
+                "• Ubuntu/Debian: sudo apt install ffmpeg\n"
+                "• Windows: Download from https://ffmpeg.org/download.html\n"
+                "Make sure FFmpeg is in your system PATH."
+            )
+        
+        # Options for the long-lived yt-dlp instances used for metadata lookups.
+        # Each thread gets its own instance (YoutubeDL is not thread-safe), and
+        # reusing it keeps that thread's HTTP session and keep-alive connections
+        # to YouTube open across calls.
+        self._metadata_ydl_opts = MappingProxyType({
+            'quiet': True,
+            'noplaylist': True,
+            'skip_download': True,
+            'extract_flat': 'in_playlist',  # Only get URLs for playlist entries
+            # Don't fetch DASH/HLS manifests; metadata lookups need no extra
+            # formats (downloads of live streams re-extract with them)
+            'extractor_args': {'youtube': {'skip': ['dash', 'hls']}},
+            'socket_timeout': 30,
+            'http_headers': {'Connection': 'keep-alive'},
+        })
+        self._ydl_local = threading.local()
+        self._ydl_instances = WeakSet()
+        self._ydl_instances_lock = threading.Lock()
         
-        # Configure yt-dlp options
-        self.ydl_opts = {
+        # Thread pool for async metadata lookups, kept so its threads' yt-dlp
+        # sessions stay open between calls
+        self._metadata_executor = None
+        
+        # Base yt-dlp download options. Read-only: each download builds its own
+        # options dict on top of these, so concurrent downloads share no state.
+        self._base_ydl_opts = MappingProxyType({
             'format': 'bestaudio/best',
-            'outtmpl': str(self.output_dir / '%(title)s.%(ext)s'),
             'noplaylist': True,
             'postprocessors': [{
                 'key': 'FFmpegExtractAudio',
@@ -71,153 +247,447 @@ class YouTubeAudioDownloader:
             }],
             'ffmpeg_location': ffmpeg_path,
             'prefer_ffmpeg': True,
-        }
+            # Fetch DASH/HLS fragments in parallel and ride out flaky CDNs
+            'concurrent_fragment_downloads': 4,
+            'http_chunk_size': 10 * 1024 * 1024,
+            'retries': 5,
+            'fragment_retries': 5,
+            'skip_unavailable_fragments': True,
+            # Keep yt-dlp's messages in our log output (and subject to -q)
+            'logger': _YtDlpLogger(),
+        })
+    
+        if prewarm:
+            # Warm this thread's instance; its first use waits for the warm-up
+            # to finish so the two never touch the instance at the same time
+            prewarm_thread = threading.Thread(
+                target=self._prewarm_connection, args=(self._get_ydl(),), daemon=True
+            )
+            prewarm_thread.start()
+            self._ydl_local.prewarm_thread = prewarm_thread
+    
+    def _get_ydl(self):
+        """Return the calling thread's long-lived metadata yt-dlp instance."""
+        prewarm_thread = getattr(self._ydl_local, 'prewarm_thread', None)
+        if prewarm_thread is not None:
+            prewarm_thread.join()
+            self._ydl_local.prewarm_thread = None
+        
+        ydl = getattr(self._ydl_local, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(copy.deepcopy(dict(self._metadata_ydl_opts)))
+            self._ydl_local.ydl = ydl
+            with self._ydl_instances_lock:
+                self._ydl_instances.add(ydl)
+        return ydl
+    
+    def _prewarm_connection(self, ydl):
+        """Open a keep-alive connection to YouTube in the given yt-dlp session."""
+        try:
+            # A HEAD request opens the TLS connection without downloading the page
+            ydl.urlopen(yt_dlp.networking.HEADRequest(self.PREWARM_URL)).close()
+        except Exception:
+            pass  # Best effort; the first real request will connect instead
+    
+    def close(self):
+        """Close the metadata yt-dlp sessions and their open connections.
+        
+        Call this once no other thread is using the downloader.
+        """
+        with self._ydl_instances_lock:
+            instances = list(self._ydl_instances)
+            self._ydl_instances.clear()
+            executor, self._metadata_executor = self._metadata_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for ydl in instances:
+            ydl.close()
+        self._ydl_local = threading.local()
     
     def is_valid_youtube_url(self, url):
         """Validate if the provided URL is a valid YouTube URL."""
-        youtube_regex = re.compile(
-            r'(https?://)?(www\.)?(youtube|youtu|youtube-nocookie)\.(com|be)/'
-            r'(watch\?v=|embed/|v/|.+\?v=)?([^&=%\?]{11})'
-        )
-        return youtube_regex.match(url) is not None
+        # Cheap substring check rejects obvious non-YouTube input before the regex
+        if 'youtu' not in url:
+            return False
+        return _YOUTUBE_URL_RE.match(url) is not None
     
     def is_playlist_url(self, url):
         """Check if the URL is a YouTube playlist URL."""
-        playlist_patterns = [
-            r'[&?]list=([a-zA-Z0-9_-]+)',
-            r'youtube\.com/playlist\?list=([a-zA-Z0-9_-]+)',
-            r'youtube\.com/watch\?.*list=([a-zA-Z0-9_-]+)'
-        ]
-        return any(re.search(pattern, url) for pattern in playlist_patterns)
+        if 'list=' not in url:
+            return False
+        return _PLAYLIST_RE.search(url) is not None
     
     def extract_playlist_id(self, url):
         """Extract playlist ID from YouTube URL."""
+        playlist_match = _PLAYLIST_RE.search(url)
+        if playlist_match:
+            return playlist_match.group(1)
+        
+        # Fall back to full query string parsing
         parsed = urlparse(url)
         if 'list' in parsed.query:
             return parse_qs(parsed.query)['list'][0]
         
-        # Try regex patterns as fallback
-        playlist_match = re.search(r'[&?]list=([a-zA-Z0-9_-]+)', url)
-        if playlist_match:
-            return playlist_match.group(1)
+        return None
+    
+    def extract_video_id(self, url):
+        """Extract the 11-character video ID from a YouTube URL."""
+        video_match = _YOUTUBE_URL_RE.match(url)
+        if video_match:
+            return video_match.group(1)
         
         return None
     
-    def get_video_info(self, url):
-        """Get video information without downloading."""
+    def get_video_info(self, url, refresh=False):
+        """Get video information without downloading.
+        
+        Results are cached on disk for metadata_ttl seconds; pass refresh=True
+        to fetch fresh metadata from YouTube.
+        """
+        video_id = self.extract_video_id(url)
+        if not refresh and video_id:
+            cached = self._cache_get('videos', video_id)
+            if cached is not None:
+                return cached
+        
         try:
-            with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return {
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown')
-                }
+            info = self._extract_video_info(url, refresh=refresh)
+            video_info = {
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'uploader': info.get('uploader', 'Unknown')
+            }
         except Exception as e:
             raise Exception(f"Failed to get video info: {str(e)}")
+        
+        # Write under the same key the lookup above reads
+        self._cache_put('videos', video_id or info.get('id'), video_info)
+        return video_info
     
-    def get_playlist_info(self, url):
-        """Get playlist information and video URLs."""
+    def _extract_video_info(self, url, refresh=False, retry=True):
+        """Return the full yt-dlp info dict for a video, fetching it only once.
+        
+        Cached dicts are dropped after INFO_CACHE_TTL seconds, or earlier if
+        their format URLs expire first. Pass retry=False when the caller
+        already retries, so attempts don't multiply.
+        """
+        key = self.extract_video_id(url) or url
+        with self._info_cache_lock:
+            cached = None if refresh else self._info_cache.get(key)
+            if cached is not None:
+                expires_at, info = cached
+                if time.time() < expires_at:
+                    self._info_cache.move_to_end(key)
+                    return info
+                del self._info_cache[key]
+        
+        # process=False returns the extractor's raw result without format
+        # selection; the download later runs that step via process_ie_result
+        ydl = self._get_ydl()
+        def extract():
+            return ydl.extract_info(url, download=False, process=False)
+        info = self._with_retry(extract) if retry else extract()
+        
+        expires_at = time.time() + self.INFO_CACHE_TTL
+        formats_expire_at = _formats_expire_at(info)
+        if formats_expire_at:
+            expires_at = min(expires_at, formats_expire_at - 60)
+        
+        with self._info_cache_lock:
+            # Drop expired entries now rather than waiting for a re-lookup
+            now = time.time()
+            for stale_key in [k for k, (expires, _) in self._info_cache.items() if expires <= now]:
+                del self._info_cache[stale_key]
+            self._info_cache[key] = (expires_at, info)
+            self._info_cache.move_to_end(key)
+            while len(self._info_cache) > self.INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+        
+        return info
+    
+    def _forget_video_info(self, url):
+        """Drop a video's cached info dict so the next use re-extracts it."""
+        with self._info_cache_lock:
+            self._info_cache.pop(self.extract_video_id(url) or url, None)
+    
+    def get_playlist_info(self, url, refresh=False):
+        """Get playlist information and a lazy iterator over its videos.
+        
+        Entries come straight from the flat listing, so durations may be
+        missing; use get_playlist_info_fast for full per-video details.
+        Fully listed playlists are cached on disk for metadata_ttl seconds;
+        pass refresh=True to fetch a fresh listing from YouTube.
+        """
         if not self.is_playlist_url(url):
             raise ValueError("URL is not a valid YouTube playlist")
         
+        playlist_id = self.extract_playlist_id(url)
+        if not refresh:
+            cached = self._cache_get('playlists', playlist_id)
+            if cached is not None:
+                cached['videos'] = iter(cached['videos'])
+                return cached
+        
         try:
-            # Configure yt-dlp for playlist extraction
-            playlist_opts = {
-                'quiet': True,
-                'extract_flat': True,  # Only get URLs, don't download
-                'playlistend': None,   # Get all videos
+            # Query the canonical playlist URL so the shared (noplaylist) instance
+            # extracts the playlist rather than a single video from a watch URL.
+            # process=False skips yt-dlp's per-entry processing and leaves
+            # 'entries' as the extractor's lazy, page-by-page generator. The
+            # generator keeps using this thread's instance; download_playlist
+            # only pages it from its producer thread while this thread waits.
+            ydl = self._get_ydl()
+            info = self._with_retry(lambda: ydl.extract_info(
+                f"https://www.youtube.com/playlist?list={playlist_id}", download=False, process=False
+            ))
+            
+            # Unprocessed results may be a redirect to the actual playlist page
+            if info.get('_type') in ('url', 'url_transparent') and 'entries' not in info:
+                info = self._with_retry(lambda: ydl.extract_info(
+                    info['url'], download=False, process=False
+                ))
+            
+            if 'entries' not in info:
+                raise Exception("No videos found in playlist")
+            
+            entries = info['entries']
+            
+            video_count = info.get('playlist_count')
+            if video_count is None and isinstance(entries, list):
+                video_count = len(entries)
+            
+            playlist_info = {
+                'title': info.get('title', 'Unknown Playlist'),
+                'uploader': info.get('uploader', 'Unknown'),
+                'video_count': video_count,
             }
             
-            with yt_dlp.YoutubeDL(playlist_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                if 'entries' not in info:
-                    raise Exception("No videos found in playlist")
-                
-                # Extract video information
+            # Build video dicts lazily so callers can start on the first
+            # videos without walking the whole playlist. The listing is only
+            # cached once it has been read to the end.
+            def iter_videos():
                 videos = []
-                for entry in info['entries']:
+                for entry in entries:
                     if entry:  # Skip None entries (private/deleted videos)
-                        videos.append({
+                        video = {
+                            'id': entry['id'],
                             'url': f"https://www.youtube.com/watch?v={entry['id']}",
                             'title': entry.get('title', 'Unknown Title'),
                             'duration': entry.get('duration', 0),
                             'uploader': entry.get('uploader', 'Unknown')
-                        })
-                
-                playlist_info = {
-                    'title': info.get('title', 'Unknown Playlist'),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'video_count': len(videos),
-                    'videos': videos
-                }
-                
-                return playlist_info
+                        }
+                        videos.append(video)
+                        yield video
                 
+                self._cache_put('playlists', playlist_id, {**playlist_info, 'videos': videos})
+            
+            playlist_info['videos'] = iter_videos()
+            
+            return playlist_info
+            
         except Exception as e:
             raise Exception(f"Failed to get playlist info: {str(e)}")
     
+    async def aget_video_info(self, url, refresh=False):
+        """Async variant of get_video_info.
+        
+        yt-dlp is blocking, so the lookup runs in the event loop's thread pool;
+        each pool thread reuses its own yt-dlp session and connections.
+        """
+        with self._ydl_instances_lock:
+            if self._metadata_executor is None:
+                self._metadata_executor = ThreadPoolExecutor(max_workers=self.METADATA_CONCURRENCY)
+            executor = self._metadata_executor
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(self.get_video_info, url, refresh=refresh)
+        )
+    
+    def get_playlist_info_fast(self, url, refresh=False):
+        """Get playlist information with full details for every video.
+        
+        Flat playlist listings may lack durations and uploaders; this looks up
+        each video concurrently (METADATA_CONCURRENCY at a time) and returns
+        'videos' as a list. Videos whose lookup fails keep their listing data.
+        """
+        playlist_info = self.get_playlist_info(url, refresh=refresh)
+        videos = list(playlist_info['videos'])
+        
+        async def fetch_all():
+            semaphore = asyncio.Semaphore(self.METADATA_CONCURRENCY)
+            
+            async def fetch(video):
+                async with semaphore:
+                    return await self.aget_video_info(video['url'], refresh=refresh)
+            
+            return await asyncio.gather(*(fetch(video) for video in videos), return_exceptions=True)
+        
+        for video, details in zip(videos, asyncio.run(fetch_all())):
+            if not isinstance(details, Exception):
+                video.update(details)
+        
+        playlist_info['videos'] = videos
+        playlist_info['video_count'] = len(videos)
+        return playlist_info
+    
+    def _with_retry(self, fn, attempts=None):
+        """Call fn, retrying transient yt-dlp errors with exponential backoff."""
+        attempts = attempts or self.RETRY_ATTEMPTS
+        for attempt in range(attempts):
+            try:
+                return fn()
+            except yt_dlp.utils.DownloadError as e:
+                message = str(e).lower()
+                if attempt == attempts - 1 or not any(err in message for err in _TRANSIENT_ERRORS):
+                    raise
+                backoff = 2 ** attempt + random.random()
+                logger.warning("⚠️  Transient error, retrying in %.1fs: %s", backoff, e)
+                # Backoffs are served one at a time, which staggers restarts;
+                # the gate is released before the retried call itself runs
+                with self._retry_gate:
+                    time.sleep(backoff)
+    
+    def _init_metadata_cache(self):
+        """Create the on-disk metadata cache tables if needed."""
+        try:
+            with closing(sqlite3.connect(self._cache_path)) as db, db:
+                for table in ('videos', 'playlists'):
+                    db.execute(
+                        f"CREATE TABLE IF NOT EXISTS {table} "
+                        "(id TEXT PRIMARY KEY, json BLOB, fetched_at INTEGER)"
+                    )
+        except sqlite3.Error as e:
+            logger.warning("Warning: metadata cache disabled: %s", e)
+            self._cache_path = None
+    
+    def _cache_get(self, table, key):
+        """Return a cached metadata dict, or None if missing or expired."""
+        if self._cache_path is None or not key:
+            return None
+        
+        try:
+            with closing(sqlite3.connect(self._cache_path)) as db:
+                row = db.execute(
+                    f"SELECT json, fetched_at FROM {table} WHERE id = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        
+        if row is None or time.time() - row[1] >= self.metadata_ttl:
+            return None
+        
+        try:
+            return json.loads(zlib.decompress(row[0]))
+        except (zlib.error, ValueError):
+            # A corrupt entry is treated as a miss and overwritten on the next fetch
+            return None
+    
+    def _cache_put(self, table, key, value):
+        """Store a metadata dict in the on-disk cache (compressed JSON)."""
+        if self._cache_path is None or not key:
+            return
+        
+        try:
+            with closing(sqlite3.connect(self._cache_path)) as db, db:
+                db.execute(
+                    f"INSERT OR REPLACE INTO {table} (id, json, fetched_at) VALUES (?, ?, ?)",
+                    (key, zlib.compress(json.dumps(value).encode('utf-8')), int(time.time()))
+                )
+        except sqlite3.Error:
+            pass
+    
     def download_audio(self, url, output_filename=None):
         """Download audio from YouTube URL and convert to MP3."""
+        return self._download_one(url, self.output_dir, output_filename)
+    
+    def _download_one(self, url, output_dir, output_filename=None):
+        """Download a single video's audio into output_dir and return the MP3 path."""
         if not self.is_valid_youtube_url(url):
             raise ValueError("Invalid YouTube URL provided")
         
         try:
-            # Get video info first
-            video_info = self.get_video_info(url)
-            print(f"Downloading: {video_info['title']}")
-            print(f"Uploader: {video_info['uploader']}")
+            # Get video info first (reused below so the video is only extracted once)
+            video_info = self._extract_video_info(url)
+            title = video_info.get('title', 'Unknown')
+            logger.info("Downloading: %s", title)
+            logger.debug("Uploader: %s", video_info.get('uploader', 'Unknown'))
             
             # Sanitize the title for filename
-            safe_title = self._sanitize_filename(video_info['title'])
-            
-            # Configure output template for this download
-            current_ydl_opts = self.ydl_opts.copy()
+            safe_title = self._sanitize_filename(title)
             
             if output_filename:
                 # Use custom filename if provided
-                base_name = output_filename.replace('.mp3', '')
-                safe_base_name = self._sanitize_filename(base_name)
-                current_ydl_opts['outtmpl'] = str(self.output_dir / f"{safe_base_name}.%(ext)s")
-                expected_final_name = f"{safe_base_name}.mp3"
+                base_name = self._sanitize_filename(output_filename.replace('.mp3', ''))
             else:
                 # Use sanitized video title
-                current_ydl_opts['outtmpl'] = str(self.output_dir / f"{safe_title}.%(ext)s")
-                expected_final_name = f"{safe_title}.mp3"
+                base_name = safe_title
             
-            # Add verbose output for debugging
-            current_ydl_opts['verbose'] = False  # Set to True for debugging
+            # Configure output template for this download
+            ydl_opts = {
+                **self._base_ydl_opts,
+                'outtmpl': str(output_dir / f"{base_name}.%(ext)s"),
+                # Progress bars are written straight to the terminal
+                'noprogress': not logger.isEnabledFor(logging.INFO),
+            }
             
-            print(f"Output directory: {self.output_dir}")
-            print(f"Expected filename: {expected_final_name}")
+            logger.debug("Output directory: %s", output_dir)
+            logger.debug("Expected filename: %s.mp3", base_name)
             
             # Download and convert the audio using yt-dlp
-            with yt_dlp.YoutubeDL(current_ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                def download():
+                    # This whole step is retried, so don't retry the lookup too
+                    current_info = self._extract_video_info(url, retry=False)
+                    if not _is_reusable_for_download(current_info):
+                        # Metadata lookups skip DASH/HLS manifests, which live
+                        # streams need; extract afresh with the download options
+                        return ydl.extract_info(url, download=True)
+                    
+                    # A failed attempt may have stale format URLs; drop the
+                    # cached info so a retry (or a later call) re-extracts it
+                    try:
+                        # process_ie_result mutates the dict, so keep the cached copy intact
+                        return ydl.process_ie_result(copy.deepcopy(current_info), download=True)
+                    except yt_dlp.utils.DownloadError:
+                        self._forget_video_info(url)
+                        raise
                 
-                # Look for the downloaded MP3 file
-                final_path = self.output_dir / expected_final_name
+                info = self._with_retry(download)
                 
-                # If the exact expected file doesn't exist, search for any MP3 files
+                # The video won't be looked up again, so free its (large) info dict
+                self._forget_video_info(url)
+                
+                # yt-dlp reports where the converted file ended up; otherwise
+                # derive it from the output template (FFmpegExtractAudio swaps
+                # the extension to .mp3)
+                requested_downloads = info.get('requested_downloads') or [{}]
+                final_path = requested_downloads[0].get('filepath')
+                if final_path:
+                    final_path = Path(final_path)
+                else:
+                    final_path = Path(ydl.prepare_filename(info)).with_suffix('.mp3')
+                
+                # Only scan the directory if the reported file is missing
                 if not final_path.exists():
-                    print(f"Expected file not found: {final_path}")
-                    print("Searching for downloaded files...")
+                    logger.warning("Expected file not found: %s", final_path)
+                    logger.debug("Searching for downloaded files...")
                     
-                    # List all files in the output directory
-                    all_files = list(self.output_dir.glob("*"))
-                    print(f"Files in directory: {[f.name for f in all_files]}")
+                    # List the output directory in a single scandir pass
+                    with os.scandir(output_dir) as it:
+                        all_files = list(it)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Files in directory: %s", [f.name for f in all_files])
                     
                     # Search for MP3 files
-                    mp3_files = list(self.output_dir.glob("*.mp3"))
+                    mp3_files = [f for f in all_files if f.name.endswith('.mp3')]
                     if mp3_files:
-                        # Get the most recently created MP3 file
-                        final_path = max(mp3_files, key=os.path.getctime)
-                        print(f"Found MP3 file: {final_path}")
+                        # Get the most recently created MP3 file (DirEntry caches stat results)
+                        final_path = Path(max(mp3_files, key=lambda f: f.stat().st_ctime).path)
+                        logger.info("Found MP3 file: %s", final_path)
                     else:
-                        raise Exception(f"No MP3 file found in {self.output_dir}. Files present: {[f.name for f in all_files]}")
+                        raise Exception(f"No MP3 file found in {output_dir}. Files present: {[f.name for f in all_files]}")
                 
-                print(f"✓ Audio downloaded successfully: {final_path}")
+                logger.info("✓ Audio downloaded successfully: %s", final_path)
                 return str(final_path)
                 
         except yt_dlp.utils.DownloadError as e:
@@ -232,119 +702,293 @@ class YouTubeAudioDownloader:
         results = []
         for i, url in enumerate(urls, 1):
             try:
-                print(f"\n[{i}/{len(urls)}] Processing: {url}")
+                logger.info("\n[%s/%s] Processing: %s", i, len(urls), url)
                 result = self.download_audio(url)
                 results.append({"url": url, "file": result, "status": "success"})
             except Exception as e:
-                print(f"✗ Failed to download {url}: {e}")
+                logger.warning("✗ Failed to download %s: %s", url, e)
                 results.append({"url": url, "file": None, "status": "failed", "error": str(e)})
         
         return results
     
-    def download_playlist(self, playlist_url, max_videos=None, delay_between_downloads=1):
-        """Download all audio from a YouTube playlist."""
+    def download_playlist(self, playlist_url, max_videos=None, delay_between_downloads=1, max_workers=4,
+                          refresh=False):
+        """Download all audio from a YouTube playlist.
+        
+        With max_workers > 1 videos are downloaded in parallel; with a single
+        worker the whole playlist is handed to one yt-dlp session.
+        """
         if not self.is_playlist_url(playlist_url):
             raise ValueError("URL is not a valid YouTube playlist")
         
         try:
             # Get playlist information
-            print("📋 Analyzing playlist...")
-            playlist_info = self.get_playlist_info(playlist_url)
+            logger.info("📋 Analyzing playlist...")
+            playlist_info = self.get_playlist_info(playlist_url, refresh=refresh)
             
-            print(f"Playlist: {playlist_info['title']}")
-            print(f"Uploader: {playlist_info['uploader']}")
-            print(f"Total videos: {playlist_info['video_count']}")
+            logger.info("Playlist: %s", playlist_info['title'])
+            logger.info("Uploader: %s", playlist_info['uploader'])
+            video_count = playlist_info['video_count']
+            logger.info("Total videos: %s", 'unknown' if video_count is None else video_count)
             
             # Limit videos if specified
             videos_to_download = playlist_info['videos']
+            expected_videos = playlist_info['video_count']
             if max_videos and max_videos > 0:
-                videos_to_download = videos_to_download[:max_videos]
-                print(f"Limiting download to first {max_videos} videos")
+                videos_to_download = islice(videos_to_download, max_videos)
+                expected_videos = min(expected_videos or max_videos, max_videos)
+                logger.info("Limiting download to first %s videos", max_videos)
             
             # Create playlist-specific subdirectory
             playlist_name = self._sanitize_filename(playlist_info['title'])
             playlist_dir = self.output_dir / playlist_name
             playlist_dir.mkdir(exist_ok=True)
             
-            # Temporarily change output directory
-            original_output_dir = self.output_dir
-            self.output_dir = playlist_dir
-            self.ydl_opts['outtmpl'] = str(playlist_dir / '%(title)s.%(ext)s')
+            max_workers = max(1, max_workers or 1)
+            logger.info("\n🎵 Starting download of %s videos (%s workers)...", expected_videos or 'all', max_workers)
+            logger.info("📁 Saving to: %s", playlist_dir)
+            logger.info("=" * 50)
             
-            print(f"\n🎵 Starting download of {len(videos_to_download)} videos...")
-            print(f"📁 Saving to: {playlist_dir}")
-            print("=" * 50)
-            
-            results = []
-            successful_downloads = 0
-            
-            for i, video in enumerate(videos_to_download, 1):
-                try:
-                    print(f"\n[{i}/{len(videos_to_download)}] {video['title']}")
-                    print(f"🔗 {video['url']}")
-                    
-                    result = self.download_audio(video['url'])
-                    results.append({
-                        "video": video,
-                        "file": result,
-                        "status": "success"
-                    })
-                    successful_downloads += 1
-                    
-                    # Add delay between downloads to be respectful
-                    if delay_between_downloads > 0 and i < len(videos_to_download):
-                        print(f"⏳ Waiting {delay_between_downloads} seconds...")
-                        time.sleep(delay_between_downloads)
-                        
-                except Exception as e:
-                    print(f"✗ Failed to download: {e}")
-                    results.append({
-                        "video": video,
-                        "file": None,
-                        "status": "failed",
-                        "error": str(e)
-                    })
-                    continue
-            
-            # Restore original output directory
-            self.output_dir = original_output_dir
-            self.ydl_opts['outtmpl'] = str(original_output_dir / '%(title)s.%(ext)s')
+            if max_workers == 1:
+                results = self._download_playlist_native(
+                    playlist_url, list(videos_to_download), playlist_dir, delay_between_downloads, max_videos
+                )
+            else:
+                results = self._download_playlist_parallel(
+                    videos_to_download, expected_videos, playlist_dir, delay_between_downloads, max_workers
+                )
+            successful_downloads = sum(1 for result in results if result['status'] == 'success')
+            total_videos = len(results)
             
             # Summary
-            print("\n" + "=" * 50)
-            print(f"🎉 Playlist download completed!")
-            print(f"✅ Successfully downloaded: {successful_downloads}/{len(videos_to_download)}")
-            print(f"❌ Failed downloads: {len(videos_to_download) - successful_downloads}")
-            print(f"📁 Files saved to: {playlist_dir}")
+            logger.info("\n" + "=" * 50)
+            logger.info("🎉 Playlist download completed!")
+            logger.info("✅ Successfully downloaded: %s/%s", successful_downloads, total_videos)
+            logger.info("❌ Failed downloads: %s", total_videos - successful_downloads)
+            logger.info("📁 Files saved to: %s", playlist_dir)
             
+            # The lazy listing has been consumed by now; report the videos processed
             return {
-                "playlist_info": playlist_info,
+                "playlist_info": {**playlist_info, 'videos': [result['video'] for result in results]},
                 "results": results,
                 "successful_downloads": successful_downloads,
-                "total_videos": len(videos_to_download),
+                "total_videos": total_videos,
                 "output_directory": str(playlist_dir)
             }
             
         except Exception as e:
-            # Restore original output directory in case of error
-            if 'original_output_dir' in locals():
-                self.output_dir = original_output_dir
-                self.ydl_opts['outtmpl'] = str(original_output_dir / '%(title)s.%(ext)s')
             raise Exception(f"Playlist download failed: {str(e)}")
     
+    def _download_playlist_parallel(self, videos, expected_videos, playlist_dir, delay_between_downloads, max_workers):
+        """Download playlist videos concurrently, one yt-dlp session per video.
+        
+        A producer thread reads the (lazy) video listing into a bounded queue
+        while a pool of workers downloads from it, so listing and downloading
+        overlap and the queue applies backpressure to the listing.
+        """
+        results = []
+        results_lock = threading.Lock()
+        work_queue = queue.Queue(maxsize=self.PLAYLIST_QUEUE_SIZE)
+        listing_errors = []
+        # Set when the caller is interrupted (e.g. Ctrl-C) so the producer
+        # and workers stop picking up new videos
+        stop = threading.Event()
+        
+        def put(item):
+            # Time out regularly so a full queue can't hide a stop request
+            while not stop.is_set():
+                try:
+                    work_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        # Downloads may start at most once per delay, however many workers
+        # are running, so the pool stays polite to YouTube
+        rate_limiter = RateLimiter(delay_between_downloads)
+        
+        def produce():
+            # Workers write in parallel, so every video needs its own output
+            # file: skip repeated entries and give clashing titles the video ID
+            seen_ids = set()
+            used_names = set()
+            try:
+                for video in videos:
+                    if stop.is_set():
+                        break
+                    if video['id'] in seen_ids:
+                        continue
+                    seen_ids.add(video['id'])
+                    
+                    # Compare names as _download_one will sanitize them
+                    output_filename = self._sanitize_filename(video['title'].replace('.mp3', ''))
+                    if output_filename.lower() in used_names:
+                        # Shorten the title so the suffix survives the 100-char limit
+                        suffix = f" [{video['id']}]"
+                        output_filename = output_filename[:100 - len(suffix)].rstrip() + suffix
+                    used_names.add(output_filename.lower())
+                    
+                    if not put((video, output_filename)):
+                        break
+            except Exception as e:
+                listing_errors.append(e)
+            finally:
+                # One sentinel per worker signals the end of the listing
+                # (after a stop the main thread sends them instead)
+                for _ in range(max_workers):
+                    if not put(None):
+                        break
+        
+        def consume():
+            while True:
+                item = work_queue.get()
+                if item is None or stop.is_set():
+                    return
+                video, output_filename = item
+                
+                try:
+                    rate_limiter.acquire()
+                    result = self._download_one(video['url'], playlist_dir, output_filename)
+                    with results_lock:
+                        results.append({
+                            "video": video,
+                            "file": result,
+                            "status": "success"
+                        })
+                        logger.info("\n[%s/%s] ✓ %s", len(results), expected_videos or '?', video['title'])
+                        
+                except Exception as e:
+                    with results_lock:
+                        results.append({
+                            "video": video,
+                            "file": None,
+                            "status": "failed",
+                            "error": str(e)
+                        })
+                        logger.warning("\n[%s/%s] ✗ Failed to download %s: %s", len(results), expected_videos or '?', video['title'], e)
+                        logger.warning("🔗 %s", video['url'])
+        
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            workers = [executor.submit(consume) for _ in range(max_workers)]
+            try:
+                for worker in workers:
+                    worker.result()
+            except BaseException:
+                # Let in-flight downloads finish but drop everything queued,
+                # then wake idle workers so the pool can shut down
+                stop.set()
+                while True:
+                    try:
+                        work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                for _ in range(max_workers):
+                    try:
+                        work_queue.put_nowait(None)
+                    except queue.Full:
+                        break  # Workers exit on any item once stop is set
+                raise
+        
+        producer.join()
+        if listing_errors:
+            logger.warning("⚠️  Playlist listing stopped early: %s", listing_errors[0])
+        
+        return results
+    
+    def _download_playlist_native(self, playlist_url, videos, playlist_dir, delay_between_downloads, max_videos=None):
+        """Download playlist videos sequentially in a single yt-dlp session."""
+        downloaded_files = {}
+        
+        def record_file(d):
+            # MoveFiles runs last, once the MP3 conversion is done
+            if d['status'] == 'finished' and d['postprocessor'] == 'MoveFiles':
+                info = d['info_dict']
+                downloaded_files[info['id']] = {
+                    'id': info['id'],
+                    'url': info.get('webpage_url') or f"https://www.youtube.com/watch?v={info['id']}",
+                    'title': info.get('title', 'Unknown Title'),
+                    'duration': info.get('duration', 0),
+                    'uploader': info.get('uploader', 'Unknown'),
+                    'filepath': info['filepath'],
+                }
+                logger.info("✓ Audio downloaded successfully: %s", info['filepath'])
+        
+        playlist_opts = {
+            **self._base_ydl_opts,
+            'outtmpl': str(playlist_dir / '%(playlist_index)s - %(title)s.%(ext)s'),
+            'noplaylist': False,
+            'playlistend': max_videos if max_videos and max_videos > 0 else None,
+            'sleep_interval': delay_between_downloads,
+            'ignoreerrors': True,  # Keep going past private/deleted videos
+            'postprocessor_hooks': [record_file],
+            'noprogress': not logger.isEnabledFor(logging.INFO),
+        }
+        
+        with yt_dlp.YoutubeDL(playlist_opts) as ydl:
+            ydl.download([playlist_url])
+        
+        # yt-dlp walks the playlist itself, so the hook is the record of what
+        # was downloaded; listed videos without a file are the failures
+        results = []
+        for video in videos:
+            downloaded = downloaded_files.pop(video['id'], None)
+            if downloaded:
+                results.append({
+                    "video": video,
+                    "file": downloaded['filepath'],
+                    "status": "success"
+                })
+            else:
+                results.append({
+                    "video": video,
+                    "file": None,
+                    "status": "failed",
+                    "error": "Download failed (see yt-dlp output above)"
+                })
+        
+        # Videos yt-dlp found that the listing didn't (e.g. a stale cached listing)
+        for downloaded in downloaded_files.values():
+            file_path = downloaded.pop('filepath')
+            results.append({
+                "video": downloaded,
+                "file": file_path,
+                "status": "success"
+            })
+        
+        return results
+    
     def _sanitize_filename(self, filename):
         """Sanitize filename for filesystem compatibility."""
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        
-        # Limit length and strip whitespace
-        filename = filename.strip()[:100]
+        # Limit length and strip whitespace before replacing invalid
+        # characters, so long titles are never translated in full
+        filename = filename.strip()[:100].translate(self._SANITIZE_TABLE)
         
         return filename or "Unknown_Playlist"
 
 
+def _configure_logging(level):
+    """Send log output through a queue so download threads never block on stdout.
+    
+    Returns the started QueueListener; call stop() on it to flush pending output.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    log_queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    
+    logger.setLevel(level)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    
+    listener.start()
+    return listener
+
+
 def main():
     """Main function to handle command-line usage."""
     parser = argparse.ArgumentParser(
@@ -361,6 +1005,7 @@ Examples:
     %(prog)s --playlist "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLMHjMZOz59Ys8KQJOx"
     %(prog)s --playlist --max-videos 10 "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLMHjMZOz59Ys8KQJOx"
     %(prog)s --playlist --delay 2 "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLMHjMZOz59Ys8KQJOx"
+    %(prog)s --playlist --workers 2 "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLMHjMZOz59Ys8KQJOx"
         """
     )
     
@@ -399,8 +1044,41 @@ Examples:
         help="Delay between downloads in seconds (default: 1.0)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of parallel downloads for playlists (default: 4)"
+    )
+    
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached playlist metadata and fetch it again from YouTube"
+    )
+    
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only show warnings and errors"
+    )
+    
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Show detailed progress for each download"
+    )
+    
     args = parser.parse_args()
     
+    if args.quiet:
+        log_level = logging.WARNING
+    elif args.verbose:
+        log_level = logging.DEBUG
+    else:
+        log_level = logging.INFO
+    log_listener = _configure_logging(log_level)
+    
     try:
         # Create downloader instance
         downloader = YouTubeAudioDownloader(output_dir=args.directory)
@@ -411,35 +1089,41 @@ Examples:
         if is_playlist:
             # Download playlist
             if args.output:
-                print("⚠️  Warning: --output option is ignored for playlists")
+                logger.warning("⚠️  Warning: --output option is ignored for playlists")
             
             result = downloader.download_playlist(
                 args.url,
                 max_videos=args.max_videos,
-                delay_between_downloads=args.delay
+                delay_between_downloads=args.delay,
+                max_workers=args.workers,
+                refresh=args.refresh
             )
             
-            print(f"\n🎉 Playlist download completed!")
-            print(f"✅ Successfully downloaded: {result['successful_downloads']}/{result['total_videos']} videos")
-            print(f"📁 Files saved to: {result['output_directory']}")
+            logger.info("\n🎉 Playlist download completed!")
+            logger.info("✅ Successfully downloaded: %s/%s videos", result['successful_downloads'], result['total_videos'])
+            logger.info("📁 Files saved to: %s", result['output_directory'])
             
         else:
             # Download single video
             if args.max_videos:
-                print("⚠️  Warning: --max-videos option is ignored for single videos")
+                logger.warning("⚠️  Warning: --max-videos option is ignored for single videos")
             if args.delay != 1.0:
-                print("⚠️  Warning: --delay option is ignored for single videos")
+                logger.warning("⚠️  Warning: --delay option is ignored for single videos")
+            if args.workers != 4:
+                logger.warning("⚠️  Warning: --workers option is ignored for single videos")
                 
             result = downloader.download_audio(args.url, args.output)
-            print(f"\n🎵 Download completed successfully!")
-            print(f"File saved to: {result}")
+            logger.info("\n🎵 Download completed successfully!")
+            logger.info("File saved to: %s", result)
         
     except KeyboardInterrupt:
-        print("\n⏹️  Download cancelled by user")
+        logger.warning("\n⏹️  Download cancelled by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        logger.error("\n❌ Error: %s", e)
         sys.exit(1)
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":